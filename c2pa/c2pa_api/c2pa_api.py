@@ -238,10 +238,12 @@ def sign_ps256_shell(data: bytes, key_path: str) -> bytes:
         return signature.read()
 
 # Example of using python crypto to sign data using openssl with Ps256
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
-
+# cryptography is imported here so that it is only loaded (and only required)
+# when this example signer is actually used
 def sign_ps256(data: bytes, key: bytes) -> bytes:
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import padding
+
     private_key = serialization.load_pem_private_key(
         key,
         password=None,
@@ -1,9 +1,10 @@
 from c2pa import  Builder, Error,  Reader, SigningAlg, create_signer,  sdk_version, sign_ps256
 import os
 import io
-PROJECT_PATH = os.getcwd()
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_PATH = os.path.join(PROJECT_PATH, "tests", "fixtures")
 
-testPath = os.path.join(PROJECT_PATH, "tests", "fixtures", "C.jpg")
+testPath = os.path.join(FIXTURES_PATH, "C.jpg")
 
 manifestDefinition = {
     "claim_generator": "python_test",
@@ -29,15 +30,14 @@ manifestDefinition = {
         }
     ]
 }
-private_key = open("tests/fixtures/ps256.pem","rb").read()
+private_key = open(os.path.join(FIXTURES_PATH, "ps256.pem"),"rb").read()
 
 # Define a function that signs data with PS256 using a private key
 def sign(data: bytes) -> bytes:
-    print("date len = ", len(data))
     return sign_ps256(data, private_key)
 
 # load the public keys from a pem file
-certs = open("tests/fixtures/ps256.pub","rb").read()
+certs = open(os.path.join(FIXTURES_PATH, "ps256.pub"),"rb").read()
 
 # Create a local Ps256 signer with certs and a timestamp server
 signer = create_signer(sign, SigningAlg.PS256, certs, "http://timestamp.digicert.com")
@@ -46,19 +46,19 @@ builder = Builder(manifestDefinition)
 
 source = open(testPath, "rb").read()
 
-testPath = "/Users/gpeacock/Pictures/Lightroom Saved Photos/IMG_0483.jpg"
-testPath = "tests/fixtures/c.jpg"
-outputPath = "target/python_out.jpg"
+outputPath = os.path.join(PROJECT_PATH, "target", "python_out.jpg")
 
 def test_files_build():
-        # Delete the output file if it exists
-    if os.path.exists(outputPath):
+    # Delete the output file if it exists
+    try:
         os.remove(outputPath)
+    except FileNotFoundError:
+        pass
     builder.sign_file(signer, testPath, outputPath)
 
 def test_streams_build():
     #with open(testPath, "rb") as file:
-    output = io.BytesIO(bytearray())
+    output = io.BytesIO()
     builder.sign(signer, "image/jpeg", io.BytesIO(source), output)
 
 def test_func(benchmark):
@@ -10,7 +10,6 @@
 # specific language governing permissions and limitations under
 # each license.
 
-import json
 import os
 import pytest
 import tempfile
@@ -19,12 +18,7 @@ import unittest
 
 from c2pa import Builder, Error, Reader, SigningAlg, create_signer, sdk_version, sign_ps256, version
 
-# a little helper function to get a value from a nested dictionary
-from functools import reduce
-import operator
-
-def getitem(d, key):
-    return reduce(operator.getitem, key, d)
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
 
 # define the manifest we will use for testing
 manifest_def = {
@@ -69,15 +63,24 @@ class TestC2paSdk(unittest.TestCase):
         assert "c2pa-rs/" in sdk_version()
 
 class TestReader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # extracted resources
+        cls.temp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
     def test_v2_read_cloud_manifest(self):
-        reader = Reader.from_file("tests/fixtures/cloud.jpg")
+        reader = Reader.from_file(os.path.join(FIXTURES_PATH, "cloud.jpg"))
         manifest = reader.get_active_manifest()
         assert manifest is not None
 
     def test_v2_read(self):
         #example of reading a manifest store from a file
         try:
-            reader = Reader.from_file("tests/fixtures/C.jpg")
+            reader = Reader.from_file(os.path.join(FIXTURES_PATH, "C.jpg"))
             manifest = reader.get_active_manifest()
             assert manifest is not None
             assert "make_test_images" in manifest["claim_generator"]
@@ -86,18 +89,18 @@ class TestReader(unittest.TestCase):
             # There should be no validation status errors
             assert manifest.get("validation_status") == None
             # read creative work assertion (author name)
-            assert getitem(manifest,("assertions",0,"label")) == "stds.schema-org.CreativeWork"
-            assert getitem(manifest,("assertions",0,"data","author",0,"name")) == "Adobe make_test"
+            assert manifest["assertions"][0]["label"] == "stds.schema-org.CreativeWork"
+            assert manifest["assertions"][0]["data"]["author"][0]["name"] == "Adobe make_test"
             # read Actions assertion
-            assert getitem(manifest,("assertions",1,"label")) == "c2pa.actions"
-            assert getitem(manifest,("assertions",1,"data","actions",0,"action")) == "c2pa.created"
+            assert manifest["assertions"][1]["label"] == "c2pa.actions"
+            assert manifest["assertions"][1]["data"]["actions"][0]["action"] == "c2pa.created"
             # read signature info
-            assert getitem(manifest,("signature_info","issuer")) == "C2PA Test Signing Cert"
+            assert manifest["signature_info"]["issuer"] == "C2PA Test Signing Cert"
             # read thumbnail data from file
-            assert getitem(manifest,("thumbnail","format")) == "image/jpeg"
+            assert manifest["thumbnail"]["format"] == "image/jpeg"
             # check the thumbnail data
-            uri = getitem(manifest,("thumbnail","identifier"))
-            reader.resource_to_file(uri, "target/thumbnail_read_v2.jpg")
+            uri = manifest["thumbnail"]["identifier"]
+            reader.resource_to_file(uri, os.path.join(self.temp_dir.name, "thumbnail_read_v2.jpg"))
 
         except Exception as e:
             print("Failed to read manifest store: " + str(e))
@@ -105,46 +108,56 @@ class TestReader(unittest.TestCase):
 
     def test_reader_from_file_no_store(self):
         with pytest.raises(Error.ManifestNotFound) as err:
-            reader = Reader.from_file("tests/fixtures/A.jpg")
+            reader = Reader.from_file(os.path.join(FIXTURES_PATH, "A.jpg"))
 
 class TestSignerr(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # every test signs with the same credentials, so build the signer once
+        with open(os.path.join(FIXTURES_PATH, "ps256.pem"), "rb") as file:
+            key = file.read()
+        def sign(data: bytes) -> bytes:
+            return sign_ps256(data, key)
+
+        with open(os.path.join(FIXTURES_PATH, "ps256.pub"), "rb") as file:
+            certs = file.read()
+        # Create a local signer from a certificate pem file
+        cls.signer = create_signer(sign, SigningAlg.PS256, certs, "http://timestamp.digicert.com")
+
+        # archives and signed outputs
+        cls.temp_dir = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
     def test_v2_sign(self):
-        # define a source folder for any assets we need to read
-        data_dir = "tests/fixtures/"
         try:
-            key = open(data_dir + "ps256.pem", "rb").read()
-            def sign(data: bytes) -> bytes:
-                return sign_ps256(data, key)
-
-            certs = open(data_dir + "ps256.pub", "rb").read()
-            # Create a local signer from a certificate pem file
-            signer = create_signer(sign, SigningAlg.PS256, certs, "http://timestamp.digicert.com")
+            signer = self.signer
 
             builder = Builder(manifest_def)
 
-            builder.add_ingredient_file(ingredient_def, data_dir + "A.jpg")
+            builder.add_ingredient_file(ingredient_def, os.path.join(FIXTURES_PATH, "A.jpg"))
 
-            builder.add_resource_file("A.jpg", data_dir + "A.jpg")
+            builder.add_resource_file("A.jpg", os.path.join(FIXTURES_PATH, "A.jpg"))
 
-            builder.to_archive(open("target/archive.zip", "wb"))
+            archive_path = os.path.join(self.temp_dir.name, "archive.zip")
+            with open(archive_path, "wb") as archive:
+                builder.to_archive(archive)
 
-            builder = Builder.from_archive(open("target/archive.zip", "rb"))
+            with open(archive_path, "rb") as archive:
+                builder = Builder.from_archive(archive)
 
-            with tempfile.TemporaryDirectory() as output_dir:
-                output_path = output_dir + "out.jpg"
-                if os.path.exists(output_path):
-                    os.remove(output_path)
-                c2pa_data = builder.sign_file(signer, data_dir + "A.jpg", output_dir + "out.jpg")
-                assert len(c2pa_data) > 0
+            output_path = os.path.join(self.temp_dir.name, "out.jpg")
+            c2pa_data = builder.sign_file(signer, os.path.join(FIXTURES_PATH, "A.jpg"), output_path)
+            assert len(c2pa_data) > 0
 
-            reader = Reader.from_file(output_dir + "out.jpg")
-            print(reader.json())
-            manifest_store = json.loads(reader.json())
-            manifest = manifest_store["manifests"][manifest_store["active_manifest"]]
+            reader = Reader.from_file(output_path)
+            manifest = reader.get_active_manifest()
             assert "python_test" in manifest["claim_generator"]
             # check custom title and format
             assert manifest["title"]== "My Title" 
-            assert manifest,["format"] == "image/jpeg"
+            assert manifest["format"] == "image/jpeg"
             # There should be no validation status errors
             assert manifest.get("validation_status") == None
             assert manifest["ingredients"][0]["relationship"] == "parentOf"
@@ -155,35 +168,27 @@ class TestSignerr(unittest.TestCase):
 
     # Test signing the same source and destination file
     def test_v2_sign_file_same(self):
-        data_dir = "tests/fixtures/"
         try:
-            key = open(data_dir + "ps256.pem", "rb").read()
-            def sign(data: bytes) -> bytes:
-                return sign_ps256(data, key)
-
-            certs = open(data_dir + "ps256.pub", "rb").read()
-            # Create a local signer from a certificate pem file
-            signer = create_signer(sign, SigningAlg.PS256, certs, "http://timestamp.digicert.com")
+            signer = self.signer
 
             builder = Builder(manifest_def)
 
-            builder.add_resource_file("A.jpg", data_dir + "A.jpg")
+            builder.add_resource_file("A.jpg", os.path.join(FIXTURES_PATH, "A.jpg"))
 
-            with tempfile.TemporaryDirectory() as output_dir:
-                path = output_dir + "/A.jpg"
-                # Copy the file from data_dir to output_dir
-                shutil.copy(data_dir + "A.jpg", path)
-                c2pa_data = builder.sign_file(signer, path, path)
-                assert len(c2pa_data) > 0
+            path = os.path.join(self.temp_dir.name, "A.jpg")
+            # Copy the fixture to the temp dir
+            shutil.copy(os.path.join(FIXTURES_PATH, "A.jpg"), path)
+            c2pa_data = builder.sign_file(signer, path, path)
+            assert len(c2pa_data) > 0
 
-                reader = Reader.from_file(path)
-                manifest = reader.get_active_manifest()
+            reader = Reader.from_file(path)
+            manifest = reader.get_active_manifest()
 
-                # check custom title and format
-                assert manifest["title"]== "My Title" 
-                assert manifest["format"] == "image/jpeg"
-                # There should be no validation status errors
-                assert manifest.get("validation_status") == None
+            # check custom title and format
+            assert manifest["title"]== "My Title" 
+            assert manifest["format"] == "image/jpeg"
+            # There should be no validation status errors
+            assert manifest.get("validation_status") == None
         except Exception as e:
             print("Failed to sign manifest store: " + str(e))
             #exit(1)
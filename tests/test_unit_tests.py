@@ -19,9 +19,19 @@ from unittest.mock import mock_open, patch
 
 from c2pa import  Builder, Error,  Reader, SigningAlg, create_signer,  sdk_version, sign_ps256
 
-PROJECT_PATH = os.getcwd()
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
 
-testPath = os.path.join(PROJECT_PATH, "tests", "fixtures", "C.jpg")
+testPath = os.path.join(FIXTURES_PATH, "C.jpg")
+
+# read the test image once, each test gets its own in-memory stream over it
+with open(testPath, "rb") as file:
+    testData = file.read()
+
+# read the PS256 signing credentials once, they are shared by every signing test
+with open(os.path.join(FIXTURES_PATH, "ps256.pem"), "rb") as file:
+    signingKey = file.read()
+with open(os.path.join(FIXTURES_PATH, "ps256.pub"), "rb") as file:
+    signingCerts = file.read()
 
 class TestC2paSdk(unittest.TestCase):
     def test_version(self):
@@ -29,18 +39,19 @@ class TestC2paSdk(unittest.TestCase):
 
 
 class TestReader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # the read tests only inspect the result, so validate C.jpg once
+        with io.BytesIO(testData) as file:
+            cls.reader = Reader("image/jpeg", file)
+
     def test_stream_read(self):
-        with open(testPath, "rb") as file:
-            reader = Reader("image/jpeg",file)
-            json = reader.json()
-            self.assertIn("C.jpg", json)
+        json = TestReader.reader.json()
+        self.assertIn("C.jpg", json)
 
     def test_stream_read_and_parse(self):
-        with open(testPath, "rb") as file:
-            reader = Reader("image/jpeg", file)
-            manifest_store = json.loads(reader.json())
-            title = manifest_store["manifests"][manifest_store["active_manifest"]]["title"]
-            self.assertEqual(title, "C.jpg")
+        title = TestReader.reader.get_active_manifest()["title"]
+        self.assertEqual(title, "C.jpg")
 
     def test_json_decode_err(self):
         with self.assertRaises(Error.Io):
@@ -48,7 +59,7 @@ class TestReader(unittest.TestCase):
 
     def test_reader_bad_format(self):
         with self.assertRaises(Error.NotSupported):
-            with open(testPath, "rb") as file:
+            with io.BytesIO(testData) as file:
                 reader = Reader("badFormat", file)
 
 
@@ -79,21 +90,21 @@ class TestBuilder(unittest.TestCase):
         ]
     }
 
+    # json form for the tests that do not exercise dict handling
+    manifestJson = json.dumps(manifestDefinition)
+
     # Define a function that signs data with PS256 using a private key
     def sign(data: bytes) -> bytes:
-        key = open("tests/fixtures/ps256.pem","rb").read()
-        return sign_ps256(data, key)
+        return sign_ps256(data, signingKey)
 
-    # load the public keys from a pem file
-    certs = open("tests/fixtures/ps256.pub","rb").read()
-
-    # Create a local Ps256 signer with certs and a timestamp server
-    signer = create_signer(sign, SigningAlg.PS256, certs, "http://timestamp.digicert.com")
+    # Create a local Ps256 signer with certs and no timestamp server,
+    # so the unit tests do not depend on the network (test_api covers timestamping)
+    signer = create_signer(sign, SigningAlg.PS256, signingCerts, None)
 
     def test_streams_sign(self):
-        with open(testPath, "rb") as file:
+        with io.BytesIO(testData) as file:
             builder = Builder(TestBuilder.manifestDefinition)
-            output = io.BytesIO(bytearray())
+            output = io.BytesIO()
             builder.sign(TestBuilder.signer, "image/jpeg", file, output)
             output.seek(0)
             reader = Reader("image/jpeg", output)
@@ -102,12 +113,12 @@ class TestBuilder(unittest.TestCase):
             self.assertNotIn("validation_status", json_data)
 
     def test_archive_sign(self):
-        with open(testPath, "rb") as file:
-            builder = Builder(TestBuilder.manifestDefinition)
-            archive = io.BytesIO(bytearray())
+        with io.BytesIO(testData) as file:
+            builder = Builder(TestBuilder.manifestJson)
+            archive = io.BytesIO()
             builder.to_archive(archive)
             builder = Builder.from_archive(archive)
-            output = io.BytesIO(bytearray())
+            output = io.BytesIO()
             builder.sign(TestBuilder.signer, "image/jpeg", file, output)
             output.seek(0)
             reader = Reader("image/jpeg", output)
@@ -116,10 +127,10 @@ class TestBuilder(unittest.TestCase):
             self.assertNotIn("validation_status", json_data)
 
     def test_remote_sign(self):
-        with open(testPath, "rb") as file:
-            builder = Builder(TestBuilder.manifestDefinition)
+        with io.BytesIO(testData) as file:
+            builder = Builder(TestBuilder.manifestJson)
             builder.set_no_embed()
-            output = io.BytesIO(bytearray())
+            output = io.BytesIO()
             manifest_data = builder.sign(TestBuilder.signer, "image/jpeg", file, output)
             output.seek(0)
             reader = Reader("image/jpeg", output, manifest_data)
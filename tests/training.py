@@ -12,24 +12,24 @@
 
 # This example shows how to add a do not train assertion to an asset and then verify it
 
-import json
 import os
 import sys
 
 from c2pa import *
 
 # set up paths to the files we we are using
-PROJECT_PATH = os.getcwd()
-testFile = os.path.join(PROJECT_PATH,"tests","fixtures","A.jpg")
-pemFile = os.path.join(PROJECT_PATH,"tests","fixtures","es256_certs.pem")
-keyFile = os.path.join(PROJECT_PATH,"tests","fixtures","es256_private.key")
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_PATH = os.path.join(PROJECT_PATH,"tests","fixtures")
+testFile = os.path.join(FIXTURES_PATH,"A.jpg")
+pemFile = os.path.join(FIXTURES_PATH,"es256_certs.pem")
+keyFile = os.path.join(FIXTURES_PATH,"es256_private.key")
 testOutputFile = os.path.join(PROJECT_PATH,"target","dnt.jpg")
 
 # a little helper function to get a value from a nested dictionary
-from functools import reduce
-import operator
 def getitem(d, key):
-    return reduce(operator.getitem, key, d)
+    for k in key:
+        d = d[k]
+    return d
 
 print("version = " + version())
 
@@ -73,23 +73,25 @@ ingredient_json = {
 # V2 signing api
 try:
     # This could be implemented on a server using an HSM
-    key = open("tests/fixtures/ps256.pem","rb").read()
+    key = open(os.path.join(FIXTURES_PATH,"ps256.pem"),"rb").read()
     def sign(data: bytes) -> bytes:
         return sign_ps256(data, key)
 
-    certs = open("tests/fixtures/ps256.pub","rb").read()
+    certs = open(os.path.join(FIXTURES_PATH,"ps256.pub"),"rb").read()
 
     # Create a signer from a certificate pem file
     signer = create_signer(sign, SigningAlg.PS256, certs, "http://timestamp.digicert.com")
 
     builder = Builder(manifest_json)
 
-    builder.add_resource_file("thumbnail", "tests/fixtures/A_thumbnail.jpg")
+    builder.add_resource_file("thumbnail", os.path.join(FIXTURES_PATH,"A_thumbnail.jpg"))
 
-    builder.add_ingredient_file(ingredient_json, "tests/fixtures/A.jpg")
+    builder.add_ingredient_file(ingredient_json, os.path.join(FIXTURES_PATH,"A.jpg"))
 
-    if os.path.exists(testOutputFile):
+    try:
         os.remove(testOutputFile)
+    except FileNotFoundError:
+        pass
 
     result = builder.sign_file(signer, testFile, testOutputFile)
 
@@ -104,17 +106,16 @@ print("V2: successfully added do not train manifest to file " + testOutputFile)
 allowed = True # opt out model, assume training is ok if the assertion doesn't exist
 try:
     reader = Reader.from_file(testOutputFile)
-    manifest_store = json.loads(reader.json())
-
-    manifest = manifest_store["manifests"][manifest_store["active_manifest"]]
+    manifest = reader.get_active_manifest()
     for assertion in manifest["assertions"]:
         if assertion["label"] == "c2pa.training-mining":
             if getitem(assertion, ("data","entries","c2pa.ai_training","use")) == "notAllowed":
                 allowed = False
+                break
 
     # get the ingredient thumbnail
     uri = getitem(manifest,("ingredients", 0, "thumbnail", "identifier"))
-    reader.resource_to_file(uri, "target/thumbnail_v2.jpg")
+    reader.resource_to_file(uri, os.path.join(PROJECT_PATH,"target","thumbnail_v2.jpg"))
 except Exception as err:
     sys.exit(err)
 